@@ -4,14 +4,17 @@ Run locally:   python app.py
 Production:    gunicorn app:app
 """
 
-from flask import Flask, render_template, request, jsonify, abort
-import json
+from flask import Flask, Response, render_template, request, abort, make_response
+from collections import Counter
+from functools import lru_cache
+import orjson
 import os
 import re
 
 app = Flask(__name__)
 
 DATA_FILE = os.path.join(os.path.dirname(__file__), "data", "drivers.json")
+CACHE_MAX_AGE = 30   # seconds a client may reuse /, /api/stats, /api/drivers
 
 # ── RE used inside the web layer ─────────────────────────────────────────────
 RE_SANITIZE  = re.compile(r'[^a-zA-Z0-9\s\-\']')   # clean user search input
@@ -22,8 +25,36 @@ RE_NAT_CLEAN = re.compile(r'\(.*?\)')                 # strip parentheses from n
 def load_drivers():
     if not os.path.exists(DATA_FILE):
         return []
-    with open(DATA_FILE, encoding="utf-8") as f:
-        return json.load(f)
+    with open(DATA_FILE, "rb") as f:
+        return orjson.loads(f.read())
+
+
+@lru_cache(maxsize=1)
+def _load_cached(mtime_ns: int) -> dict:
+    """Parse + enrich drivers.json once per file version (keyed on mtime)."""
+    drivers = [enrich(d) for d in load_drivers()]
+    return {
+        "etag":    str(mtime_ns or 0),   # data version (= cache key), for conditional GETs
+        "drivers": drivers,
+        "by_name": {d["name"]: d for d in reversed(drivers)},   # first match wins
+        "nations": sorted({d["nationality"] for d in drivers if d["nationality"] != "N/A"}),
+        "teams":   sorted({d.get("team","N/A") for d in drivers if d.get("team","N/A") != "N/A"}),
+        "stats":   build_stats(drivers),
+        # unfiltered /api/drivers body, encoded once
+        "all_json": orjson.dumps({"count": len(drivers), "drivers": drivers}),
+        # lowercase search keys, built once: (name, nationality, team, driver)
+        "search":  [(d["name"].lower(), d["nationality"].lower(), d.get("team","").lower(), d)
+                    for d in drivers],
+    }
+
+
+def load_data() -> dict:
+    """Cached, pre-enriched drivers; reloaded only when drivers.json changes."""
+    try:
+        mtime_ns = os.stat(DATA_FILE).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    return _load_cached(mtime_ns)
 
 
 def enrich(driver: dict) -> dict:
@@ -36,24 +67,52 @@ def enrich(driver: dict) -> dict:
     return driver
 
 
+def build_stats(drivers: list) -> dict:
+    """Aggregates served by /api/stats (computed once per data load)."""
+    by_nat  = Counter(d.get("nationality","N/A") for d in drivers)
+    by_team = Counter(d.get("team","N/A") for d in drivers)
+    decades = Counter(f"{(int(y.group()) // 10) * 10}s" for d in drivers
+                      if (y := RE_YEAR_ONLY.search(d.get("dob",""))))
+    return {
+        "total":       len(drivers),
+        "by_nationality": dict(by_nat.most_common(15)),
+        "by_team":     dict(by_team.most_common(15)),
+        "by_decade":   dict(decades),
+    }
+
+
+def json_response(obj) -> Response:
+    """jsonify() replacement: orjson encodes straight to UTF-8 bytes."""
+    return Response(orjson.dumps(obj), mimetype="application/json")
+
+
+def cached_response(data: dict, make_body) -> Response:
+    """Conditional GET: 304 while the client's ETag matches the data version,
+    otherwise make_body() with a weak ETag and a short max-age."""
+    if request.if_none_match.contains_weak(data["etag"]):
+        resp = Response(status=304)
+    else:
+        resp = make_response(make_body())
+    resp.set_etag(data["etag"], weak=True)
+    resp.cache_control.max_age = CACHE_MAX_AGE
+    return resp
+
+
 # ── Routes ────────────────────────────────────────────────────────────────────
 
 @app.route("/")
 def index():
-    drivers    = [enrich(d) for d in load_drivers()]
-    nations    = sorted({d["nationality"] for d in drivers if d["nationality"] != "N/A"})
-    teams      = sorted({d.get("team","N/A") for d in drivers if d.get("team","N/A") != "N/A"})
-    return render_template("index.html",
-                           drivers=drivers,
-                           nations=nations,
-                           teams=teams,
-                           total=len(drivers))
+    data = load_data()
+    return cached_response(data, lambda: render_template("index.html",
+                                                         drivers=data["drivers"],
+                                                         nations=data["nations"],
+                                                         teams=data["teams"],
+                                                         total=len(data["drivers"])))
 
 
 @app.route("/driver/<path:name>")
 def driver_detail(name):
-    drivers = load_drivers()
-    driver  = next((enrich(d) for d in drivers if d["name"] == name), None)
+    driver = load_data()["by_name"].get(name)
     if not driver:
         abort(404)
     return render_template("driver.html", driver=driver)
@@ -61,42 +120,26 @@ def driver_detail(name):
 
 @app.route("/api/drivers")
 def api_drivers():
-    drivers = [enrich(d) for d in load_drivers()]
+    data = load_data()
 
     raw_q = request.args.get("q", "")
     q     = RE_SANITIZE.sub("", raw_q).strip().lower()
     nat   = request.args.get("nationality", "").lower()
     team  = request.args.get("team", "").lower()
 
-    if q:
-        drivers = [d for d in drivers if q in d["name"].lower()]
-    if nat:
-        drivers = [d for d in drivers if nat in d["nationality"].lower()]
-    if team:
-        drivers = [d for d in drivers if team in d.get("team","").lower()]
+    if not (q or nat or team):
+        return cached_response(data, lambda: Response(data["all_json"], mimetype="application/json"))
 
-    return jsonify({"count": len(drivers), "drivers": drivers})
+    # one pass; an empty filter string is a substring of every key
+    drivers = [d for name, nationality, team_, d in data["search"]
+               if q in name and nat in nationality and team in team_]
+    return json_response({"count": len(drivers), "drivers": drivers})
 
 
 @app.route("/api/stats")
 def api_stats():
-    drivers = load_drivers()
-    by_nat, by_team, decades = {}, {}, {}
-    for d in drivers:
-        n = d.get("nationality","N/A")
-        t = d.get("team","N/A")
-        by_nat[n]  = by_nat.get(n, 0) + 1
-        by_team[t] = by_team.get(t, 0) + 1
-        y_m = RE_YEAR_ONLY.search(d.get("dob",""))
-        if y_m:
-            decade = (int(y_m.group()) // 10) * 10
-            decades[str(decade)+"s"] = decades.get(str(decade)+"s", 0) + 1
-    return jsonify({
-        "total":       len(drivers),
-        "by_nationality": dict(sorted(by_nat.items(), key=lambda x: -x[1])[:15]),
-        "by_team":     dict(sorted(by_team.items(), key=lambda x: -x[1])[:15]),
-        "by_decade":   decades,
-    })
+    data = load_data()
+    return cached_response(data, lambda: json_response(data["stats"]))
 
 
 if __name__ == "__main__":
@@ -1,36 +1,237 @@
 """
 scraper.py  ─  F1 Driver Web Crawler
 Scrapes Wikipedia for 100+ Formula 1 drivers using ONLY the Python
-standard library (urllib) + the 're' module for all data extraction.
+standard library (http.client) + the 're' module for all data extraction.
 
 Run:  python scraper.py
 Output: data/drivers.json
 """
 
 import re
-import urllib.request
+import gzip
+import hashlib
+from html import unescape
+import http.client
+import urllib.parse
 import json
 import time
 import os
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-
-#  HTTP helper
-
-HEADERS = {"User-Agent": "Mozilla/5.0 (F1CrawlerBot/1.0; educational project)"}
+from functools import lru_cache
+
+#  HTTP helper  —  pooled keep-alive connections + gzip
+
+HEADERS = {
+    "User-Agent":      "Mozilla/5.0 (F1CrawlerBot/1.0; educational project)",
+    "Accept-Encoding": "gzip",
+    "Connection":      "keep-alive",
+}
+
+TIMEOUT       = 12
+MAX_RETRIES   = 3
+BACKOFF       = 0.3                         # seconds, doubled on every retry
+RETRY_STATUS  = {429, 500, 502, 503, 504}
+REDIRECT      = {301, 302, 303, 307, 308}
+MAX_REDIRECTS = 5
+
+# Driver pages: everything parse_driver_page needs (<title> and the infobox)
+# sits near the top, well inside this many bytes even after the skin's
+# navigation markup; the article body after it is never looked at.
+DRIVER_PAGE_LIMIT = 200_000
+
+# One keep-alive connection per (thread, host), so the TLS handshake is paid
+# once per worker instead of once per page.
+_conn_local = threading.local()
+
+def _connection(scheme: str, host: str) -> http.client.HTTPConnection:
+    pool = _conn_local.__dict__.setdefault("pool", {})
+    conn = pool.get((scheme, host))
+    if conn is None:
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        conn = pool[(scheme, host)] = cls(host, timeout=TIMEOUT)
+    return conn
+
+def _drop_connection(scheme: str, host: str):
+    conn = _conn_local.__dict__.get("pool", {}).pop((scheme, host), None)
+    if conn is not None:
+        conn.close()
+
+def _get(url: str, headers: dict) -> http.client.HTTPResponse:
+    """One GET on the pooled connection; the body is read before returning."""
+    RATE_LIMITER.wait(url)   # polite crawl delay, shared across workers
+    parts = urllib.parse.urlsplit(url)
+    path  = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+    conn = _connection(parts.scheme, parts.netloc)
+    try:
+        conn.request("GET", path, headers={**HEADERS, **headers})
+        r = conn.getresponse()
+        r.body = r.read()
+    except (http.client.HTTPException, OSError):
+        _drop_connection(parts.scheme, parts.netloc)   # stale keep-alive socket
+        raise
+    if r.will_close:
+        _drop_connection(parts.scheme, parts.netloc)
+    return r
+
+def _download(url: str, headers: dict) -> http.client.HTTPResponse:
+    """GET with retries/backoff on transient errors; follows redirects."""
+    attempt, redirects = 0, 0
+    while True:
+        try:
+            r = _get(url, headers)
+        except (http.client.HTTPException, OSError):
+            if attempt >= MAX_RETRIES:
+                raise
+            time.sleep(BACKOFF * 2 ** attempt)
+            attempt += 1
+            continue
+        if r.status in REDIRECT and r.getheader("Location") and redirects < MAX_REDIRECTS:
+            url = urllib.parse.urljoin(url, r.getheader("Location"))
+            redirects += 1
+            continue
+        if r.status in REDIRECT:
+            raise OSError(f"too many redirects / bad redirect: HTTP {r.status}")
+        if r.status in RETRY_STATUS and attempt < MAX_RETRIES:
+            time.sleep(BACKOFF * 2 ** attempt)
+            attempt += 1
+            continue
+        if r.status >= 400:
+            raise OSError(f"HTTP {r.status} {r.reason}")
+        return r
+
+
+#  ON-DISK HTTP CACHE  —  URL -> gzipped body + ETag / Last-Modified
+#
+#  Entries younger than CACHE_MAX_AGE are served without touching the network;
+#  older ones are revalidated with If-None-Match / If-Modified-Since and reused
+#  on a 304.  Delete the directory (or set CACHE_DIR = "") to crawl fresh.
+
+CACHE_DIR     = ".cache"
+CACHE_MAX_AGE = 24 * 3600   # seconds
+
+def _cache_paths(url: str) -> tuple:
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    base = os.path.join(CACHE_DIR, key)
+    return base + ".html.gz", base + ".json"
+
+def _cache_read(url: str) -> tuple:
+    """(gzipped body, meta dict, age in seconds) or (None, None, None)."""
+    body_path, meta_path = _cache_paths(url)
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        with open(body_path, "rb") as f:
+            body = f.read()
+        return body, meta, time.time() - os.path.getmtime(meta_path)
+    except (OSError, ValueError):
+        return None, None, None
+
+def _cache_write(url: str, body: bytes, meta: dict):
+    body_path, meta_path = _cache_paths(url)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    for path, data, mode in ((body_path, body, "wb"), (meta_path, json.dumps(meta), "w")):
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, mode) as f:
+            f.write(data)
+        os.replace(tmp, path)   # atomic: readers never see half a file
+
+def _fetch_gzipped(url: str) -> tuple:
+    """(gzip-compressed body, charset) for url, via the disk cache if enabled."""
+    if not CACHE_DIR:
+        r = _download(url, {})
+        return _gzipped(r), r.headers.get_content_charset("utf-8")
+
+    body, meta, age = _cache_read(url)
+    if body is not None and age < CACHE_MAX_AGE:
+        return body, meta["charset"]
+
+    headers = {}
+    if meta and meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta and meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    r = _download(url, headers)
+    if r.status == 304 and body is not None:
+        os.utime(_cache_paths(url)[1])   # revalidated: fresh for another CACHE_MAX_AGE
+        return body, meta["charset"]
+
+    body = _gzipped(r)
+    charset = r.headers.get_content_charset("utf-8")
+    if r.status == 200:   # never persist redirects, 304s or other partial answers
+        _cache_write(url, body, {
+            "url":           url,
+            "etag":          r.getheader("ETag"),
+            "last_modified": r.getheader("Last-Modified"),
+            "charset":       charset,
+        })
+    return body, charset
+
+def _gzipped(r: http.client.HTTPResponse) -> bytes:
+    if r.getheader("Content-Encoding", "").lower() == "gzip":
+        return r.body
+    return gzip.compress(r.body, compresslevel=1)
 
 def fetch(url: str) -> str:
+    """GET url as text, decoded with the response charset (list pages)."""
     try:
-        req = urllib.request.Request(url, headers=HEADERS)
-        with urllib.request.urlopen(req, timeout=12) as r:
-            return r.read().decode(r.headers.get_content_charset("utf-8"), errors="replace")
+        body, charset = _fetch_gzipped(url)
+        return zlib.decompress(body, 16 + zlib.MAX_WBITS).decode(charset, errors="replace")
     except Exception as e:
         print(f"  [WARN] {url}: {e}")
         return ""
 
+def fetch_bytes(url: str, limit: int = 0) -> bytes:
+    """GET url as raw, undecoded bytes; with `limit`, only the first `limit`
+    bytes are inflated (driver pages, scanned by the bytes patterns)."""
+    try:
+        # The whole (compressed) body is always read off the socket so the
+        # keep-alive connection stays reusable; `limit` bounds how much of
+        # it is inflated and handed to the regexes.
+        body, _ = _fetch_gzipped(url)
+        return zlib.decompressobj(16 + zlib.MAX_WBITS).decompress(body, limit)
+    except Exception as e:
+        print(f"  [WARN] {url}: {e}")
+        return b""
+
+
+#  CRAWL RATE LIMITER  —  shared by all worker threads
+
+MAX_WORKERS = 12      # concurrent driver-page fetches
+CRAWL_RATE  = 8.0     # max requests per second per host
+
+class RateLimiter:
+    """Spaces out request start times per host, across threads."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self.lock = threading.Lock()
+        self.next_slot = {}
+
+    def wait(self, url: str):
+        host = url.split("/")[2] if "://" in url else url
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot.get(host, now))
+            self.next_slot[host] = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+RATE_LIMITER = RateLimiter(CRAWL_RATE)
+
 #  REGULAR EXPRESSION PATTERNS
+#
+#  RE-0 / RE-1 run on the decoded list pages (str).  Driver pages are never
+#  decoded as a whole: RE-3 to RE-8 and the infobox helpers are bytes patterns
+#  run on the raw UTF-8 page, and only the groups they capture are decoded
+#  (see _text()).
 
 # RE-0  Extract table from list / championship pages
-RE_TABLE = re.compile(r'<table class="wikitable sortable sticky-header[^"]*"[^>]*>(.*?)</table>', re.DOTALL)
+RE_TABLE = re.compile(r'<table class="wikitable sortable sticky-header[^"]*"[^>]*>([^<]*(?:<(?!/table>)[^<]*)*)</table>')
 
 # RE-1  Extract driver wiki links from list / championship pages
 #       Matches  href="/wiki/FirstName_LastName"  with a human-name guard
@@ -40,6 +241,7 @@ RE_DRIVER_LINK = re.compile(
 )
 
 # RE-2  Full name from <title>   e.g.  "Lewis Hamilton - Wikipedia"
+#       (str: applied to the decoded <title> element found by _RE_TITLE_TAG)
 RE_PAGE_TITLE = re.compile(
     r'<title>\s*([A-ZÀ-Ö][a-zA-ZÀ-ö\'\-\. ]+?)\s*[-–|]',
     re.UNICODE
@@ -47,97 +249,145 @@ RE_PAGE_TITLE = re.compile(
 
 # RE-3  Date of birth 
 RE_DOB = re.compile(
-    r'class="bday">(\d{4}-\d{2}-\d{2})<', re.IGNORECASE
+    br'class="bday">(\d{4}-\d{2}-\d{2})<', re.IGNORECASE
 )
 
+# Cell contents in the infobox patterns below are matched as
+#   [^<]*(?:<(?!/tag>)[^<]*)*     "runs of text, then any tag except the closing one"
+# instead of DOTALL '.*?'.  Each character can be matched only one way, so a
+# failing attempt cannot backtrack into the same text again.
+
 # RE-4  Birthplace City, Country / City, State, Country
-RE_BIRTHPLACE = re.compile(
-    r'class="birthplace"[^>]*>(.*?)<\/span>',
-    re.IGNORECASE | re.DOTALL
+#       Older infoboxes wrap it in a <span>, current ones in a <div>; each
+#       variant is anchored on its own opening tag and they are tried in turn.
+RE_BIRTHPLACE_DIV = re.compile(
+    br'<div[^>]*class="birthplace"[^>]*>([^<]*(?:<(?!/div>)[^<]*)*)</div>',
+    re.IGNORECASE
+)
+RE_BIRTHPLACE_SPAN = re.compile(
+    br'<span[^>]*class="birthplace"[^>]*>([^<]*(?:<(?!/span>)[^<]*)*)</span>',
+    re.IGNORECASE
 )
 
 # RE-5  Nationality / country flag text  e.g. "British" "Dutch" "Monégasque"
 RE_NATIONALITY = re.compile(
-    r'Nationality.*?</td>', 
-    re.IGNORECASE | re.DOTALL
+    br'Nationality[^<]*(?:<(?!/td>)[^<]*)*</td>',
+    re.IGNORECASE
 )
 
 # RE-6  Current F1 team  e.g.  "team = [[Mercedes AMG Petronas]]"
 RE_F1_TEAM = re.compile(
-    r'World Championship career.*?(?:team|Teams)</th><td[^>]*>(.*?)</td>',
+    br'World Championship career.{0,8000}?(?:team|Teams)</th><td[^>]*>([^<]*(?:<(?!/td>)[^<]*)*)</td>',
     re.IGNORECASE | re.DOTALL
 )
 
-# RE-7  World Championship titles  
-RE_TITLES = re.compile(
-    r'World Championship career</th></tr>.*?Championships.*?<td[^>]*>(\d+)',
-    re.IGNORECASE
-)
+# RE-7  Start of the "World Championship career" section of the stats box
+RE_STATS_HEADER = re.compile(br'World Championship career</th></tr>', re.IGNORECASE)
 
-# RE-8  Number of F1 race wins
-RE_WINS = re.compile(
-    r'World Championship career</th></tr>.*?Wins.*?<td[^>]*>(\d+)',
+# RE-8  One stats row  <th>label</th><td>value</td>  e.g. "Wins" -> "105"
+#       A single pass over the section collects every row; titles, wins,
+#       car number, podiums and poles are then dictionary lookups.
+RE_STAT_ROW = re.compile(
+    br'<th[^>]*>([^<]*(?:<(?!/th>)[^<]*)*)</th>\s*<td[^>]*>(\d*)',
     re.IGNORECASE
 )
 
-# RE-9  Car number / racing number  e.g. "car_number = 44"
-RE_NUMBER = re.compile(
-    r'World Championship career</th></tr>.*?Car number.*?<td[^>]*>(\d+)',
-    re.IGNORECASE
-)
+# Opening tag of an infobox table  —  start point for _extract_balanced_table()
+RE_INFOBOX_START = re.compile(br'<table[^>]*class="[^"]*infobox[^"]*"', re.IGNORECASE)
 
-# RE-10  Podiums  e.g. "podiums = 197"
-RE_PODIUMS = re.compile(
-    r'World Championship career</th></tr>.*?Podiums.*?<td[^>]*>(\d+)',
-    re.IGNORECASE
-)
 
-# RE-11  Pole positions  e.g. "poles = 104"
-RE_POLES = re.compile(
-    r'World Championship career</th></tr>.*?Pole Positions.*?<td[^>]*>(\d+)',
+#  HELPER PATTERNS  —  compiled once at import, used by clean() and the parsers
+#  (bytes patterns are for the raw driver page, str ones for decoded text)
+
+_RE_TAG       = re.compile(r'<[^>]+>')
+_RE_TEMPLATE  = re.compile(r'\{\{[^}]*\}\}')
+_RE_LINK      = re.compile(r'\[\[([^\]|]*\|)?([^\]]*)\]\]')
+_RE_TITLE_TAG = re.compile(br'<title>[^<]*</title>', re.IGNORECASE)
+# free text, not markup: bytes \s misses the UTF-8 no-break space (\xc2\xa0)
+# that str \s matched, so it is spelled out
+_RE_DATE_TEXT = re.compile(
+    br'(\d{1,2}(?:\s|\xc2\xa0)+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*(?:\s|\xc2\xa0)+\d{4})',
     re.IGNORECASE
 )
+_RE_YEAR_DOB  = re.compile(r'(?:19|20)\d{2}')
+_RE_FLAG_TEXT = re.compile(br'<img.*>\s*([a-zA-Z]+)<.*\/td>')
+_RE_A_TAG     = re.compile(br'<a[^>]*>([^<]+)</a>')
+_RE_TABLE_TAG = re.compile(br'<(/?)table[\s>]')   # group(1) == "/" for a closing tag
+
+# list-page table rows / cells  (fallback_data_from_list)
+_RE_ENTITY    = re.compile(r'a?&[#0-9]+;')
+_RE_TR        = re.compile(r'<tr[^>]*>([^<]*(?:<(?!/tr>)[^<]*)*)</tr>')
+_RE_TH        = re.compile(r'<th[^>]*>([^<]*(?:<(?!/th>)[^<]*)*)</th>')
+_RE_TD        = re.compile(r'<td[^>]*>([^<]*(?:<(?!/td>)[^<]*)*)</td>')
 
 
 #  UTILITY  —  strip HTML tags & decode entities
 
 def clean(text: str) -> str:
-    text = re.sub(r'<[^>]+>', ' ', text)
-    text = re.sub(r'&amp;', '&', text)
-    text = re.sub(r'&nbsp;', ' ', text)
-    text = re.sub(r'&#\d+;', '', text)
-    text = re.sub(r'\{\{[^}]*\}\}', '', text)   # remove wiki templates
-    text = re.sub(r'\[\[([^\]|]*\|)?([^\]]*)\]\]', r'\2', text)  # unwrap [[links]]
-    return re.sub(r'\s+', ' ', text).strip()
+    text = _RE_TAG.sub(' ', text)
+    text = _RE_TEMPLATE.sub('', text)   # remove wiki templates
+    text = _RE_LINK.sub(r'\2', text)    # unwrap [[links]]
+    text = unescape(text)               # &amp; &nbsp; &#160; ... in one C-level pass
+    return ' '.join(text.split())
+
+
+def _text(raw: bytes) -> str:
+    """Decode one captured group of a driver page (Wikipedia serves UTF-8)."""
+    return raw.decode("utf-8", errors="replace")
+
+
+def _extract_balanced_table(html: bytes, start_re: re.Pattern, contains: bytes = b"") -> bytes:
+    """Slice out the first table opened by start_re, up to its matching </table>.
+
+    A linear depth-counting scan over <table / </table> tags, instead of a
+    DOTALL '.*?</table>.*?</table>' regex over the whole page.  The tags come
+    from a single finditer, so each one is visited exactly once.  When
+    `contains` is given, tables whose HTML lacks it (case-insensitive) are
+    skipped.  Returns b"" if no table qualifies.
+    """
+    needle = contains.lower()
+    m = start_re.search(html)
+    while m:
+        depth, i = 1, len(html)         # unterminated (e.g. truncated page): take the rest
+        for tag in _RE_TABLE_TAG.finditer(html, m.end()):
+            depth += -1 if tag.group(1) else 1
+            if not depth:
+                i = tag.end()
+                break
+        table = html[m.start():i]
+        if needle in table.lower():
+            return table
+        m = start_re.search(html, i)
+    return b""
 
 
 #  PARSERS-each uses RE results above
 
-def parse_dob(text: str) -> str:
+def parse_dob(text: bytes) -> str:
     """Extracts human-readable DOB (e.g., 29 July 1981) from raw HTML"""
     m = RE_DOB.search(text)
     if m:
         # group(1) captures the text after the span tags but before the next '<'
-        return m.group(1).strip()
+        return _text(m.group(1).strip())
     
     # Fallback: if the bday span isn't there, look for any 'Day Month Year' pattern
-    fallback = re.search(r'(\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4})', text, re.IGNORECASE)
-    return fallback.group(1) if fallback else "N/A"
+    fallback = _RE_DATE_TEXT.search(text)
+    return _text(fallback.group(1)) if fallback else "N/A"
 
 def parse_age(dob: str) -> str:
-    y = re.search(r'(?:19|20)\d{2}', dob)
+    y = _RE_YEAR_DOB.search(dob)
     return str(date.today().year - int(y.group())) if y else "N/A"
 
-def parse_birthplace(text: str) -> str:
-    m = RE_BIRTHPLACE.search(text)
+def parse_birthplace(text: bytes) -> str:
+    m = RE_BIRTHPLACE_DIV.search(text) or RE_BIRTHPLACE_SPAN.search(text)
     if m:
         # group(1) is "<a href="...">Stevenage</a>, Hertfordshire, England"
-        raw_html = m.group(1)
+        raw_html = _text(m.group(1))
         # Use your clean function to strip the <a> tags
         return clean(raw_html)
     return "N/A"
 
-def parse_nationality(text: str) -> str:
+def parse_nationality(text: bytes) -> str:
     m = RE_NATIONALITY.search(text)
     # print(m.group(0))
     if not m:
@@ -145,15 +395,15 @@ def parse_nationality(text: str) -> str:
     
     nationality_cell = m.group(0)
     
-    links = re.findall(r'<img.*>\s*([a-zA-Z]+)<.*\/td>', nationality_cell)
+    links = _RE_FLAG_TEXT.findall(nationality_cell)
     
     if links:
-        result = links[-1].strip()
+        result = _text(links[-1].strip())
         return result
         
     return "N/A"
 
-def parse_team(text: str) -> str:
+def parse_team(text: bytes) -> str:
     # 1. Search for the team cell after the F1 header
     m = RE_F1_TEAM.search(text)
     if not m:
@@ -162,56 +412,62 @@ def parse_team(text: str) -> str:
     team_cell_content = m.group(1)
 
     # 2. Find all text inside <a> links in this specific cell
-    # Regex: r'<a[^>]*>([^<]+)</a>'
-    teams = re.findall(r'<a[^>]*>([^<]+)</a>', team_cell_content)
+    # Regex: _RE_A_TAG  r'<a[^>]*>([^<]+)</a>'
+    teams = _RE_A_TAG.findall(team_cell_content)
     
     if teams:
-        return teams[0]
+        return _text(teams[0])
         
     return "N/A"
 
-def parse_titles(infobox_html: str) -> str:
-    m = RE_TITLES.search(infobox_html)
-    return m.group(1) if m else "N/A"
+def parse_stats(statbox_html: bytes) -> dict:
+    """{row label (lowercase): number} for the World Championship career rows."""
+    m = RE_STATS_HEADER.search(statbox_html)
+    if not m:
+        return {}
+    stats = {}
+    for label, value in RE_STAT_ROW.findall(statbox_html, m.end()):
+        if value:
+            stats.setdefault(clean(_text(label)).lower(), _text(value))   # first row wins
+    return stats
+
+def parse_titles(stats: dict) -> str:
+    return stats.get("championships", "N/A")
 
-def parse_wins(text: str) -> str:
-    m = RE_WINS.search(text)
-    return m.group(1) if m else "N/A"
+def parse_wins(stats: dict) -> str:
+    return stats.get("wins", "N/A")
 
-def parse_number(text: str) -> str:
-    m = RE_NUMBER.search(text)
-    return m.group(1) if m else "N/A"
+def parse_number(stats: dict) -> str:
+    return stats.get("car number", "N/A")
 
-def parse_podiums(infobox: str) -> str:
-    m = RE_PODIUMS.search(infobox)
-    return m.group(1) if m else "N/A"
+def parse_podiums(stats: dict) -> str:
+    return stats.get("podiums", "N/A")
 
-def parse_poles(infobox: str) -> str:
-    m = RE_POLES.search(infobox)
-    return m.group(1) if m else "N/A"
+def parse_poles(stats: dict) -> str:
+    return stats.get("pole positions", "N/A")
 
 
 #  SCRAPE A SINGLE DRIVER PAGE
 
 def parse_driver_page(url: str) -> dict:
-    html = fetch(url)
+    html = fetch_bytes(url, DRIVER_PAGE_LIMIT)
     if not html:
         return {}
 
     # Extract infobox block for targeted regex
-    ib_m = re.search(
-        r'<table[^>]*class="[^"]*infobox[^"]*".*?(?:</table>).*?</table>',
-        html, re.DOTALL | re.IGNORECASE
-    )
-    ib_stats = re.search(
-        r'<table[^>]*class="[^"]*infobox[^"]*".*?World Championship career.*?(?:</table>).*?</table>',
-        html, re.DOTALL | re.IGNORECASE
-    )
-    infobox_html = ib_m.group(0) if ib_m else html[:8000]
-    statbox_html = ib_stats.group(0) if ib_stats else html[:8000]
+    # For F1 drivers the first infobox normally *is* the stats box, so only go
+    # back over the page for a second infobox when it is not.
+    infobox_html = _extract_balanced_table(html, RE_INFOBOX_START)
+    if b"world championship career" in infobox_html.lower():
+        statbox_html = infobox_html
+    else:
+        statbox_html = _extract_balanced_table(html, RE_INFOBOX_START, b"World Championship career")
+    infobox_html = infobox_html or html[:8000]
+    statbox_html = statbox_html or html[:8000]
     
 
-    name_m = RE_PAGE_TITLE.search(html)
+    title_m = _RE_TITLE_TAG.search(html)
+    name_m = RE_PAGE_TITLE.search(_text(title_m.group())) if title_m else None
     full_name = name_m.group(1).strip() if name_m else url.split("/wiki/")[-1].replace("_", " ")
 
     parts = full_name.split()
@@ -230,19 +486,20 @@ def parse_driver_page(url: str) -> dict:
     if nationality == "N/A":
         nationality = data['Nationality']
     team = parse_team(infobox_html)
-    titles = parse_titles(statbox_html)
+    stats = parse_stats(statbox_html)
+    titles = parse_titles(stats)
     if titles == "N/A":
         titles = data['Drivers\' Championships']
-    wins = parse_wins(statbox_html)
+    wins = parse_wins(stats)
     if wins == "N/A":
         wins = data['Race wins']
-    podiums = parse_podiums(statbox_html)
+    podiums = parse_podiums(stats)
     if podiums == "N/A":
         podiums = data['Podiums']
-    poles = parse_poles(statbox_html)
+    poles = parse_poles(stats)
     if poles == "N/A":
         poles = data['Pole positions']
-    number = parse_number(infobox_html)
+    number = parse_number(stats)
     return {
         "name":        full_name,
         "first_name":  first,
@@ -272,12 +529,6 @@ LIST_PAGES = [
     "https://en.wikipedia.org/wiki/List_of_Formula_One_World_Drivers%27_Champions", #not get used
 ]
 
-# Known F1 driver substrings to help filter noise
-F1_DRIVER_HINT = re.compile(
-    r'(?:Formula[_\s]One|Grand_Prix|F1|racing_driver|Formula_1)',
-    re.IGNORECASE
-)
-
 SKIP = re.compile(
     r'(Wikipedia|Category|File|Template|Help|Special|Portal|Talk|'
     r'User|Main_Page|List_of|History_of|Season|Grand_Prix_of|'
@@ -307,20 +558,21 @@ def collect_driver_links(target: int = 150) -> list:
 
     return links[:target]
 
+@lru_cache(maxsize=1)
 def fallback_data_from_list() -> list:
     data = []
     html = fetch(LIST_PAGES[0])
     
     def clean_text(text: str) -> str:
-        text = re.sub(r'<[^>]+>', '', text).strip()
-        text = re.sub(r'a?&[#0-9]+;', '', text)
+        text = _RE_TAG.sub('', text).strip()
+        text = _RE_ENTITY.sub('', text)
         return text
     table = RE_TABLE.search(html).group(1) if RE_TABLE.search(html) else html
-    rows = re.findall(r'<tr[^>]*>(.*?)</tr>', table, re.DOTALL)
-    header = re.findall(r'<th[^>]*>(.*?)</th>', rows[0], re.DOTALL)
+    rows = _RE_TR.findall(table)
+    header = _RE_TH.findall(rows[0])
     header = [clean_text(cell) for cell in header]
     for row in rows[1:]:
-        cells = re.findall(r'<td[^>]*>(.*?)</td>', row, re.DOTALL)
+        cells = _RE_TD.findall(row)
         cells = [clean_text(cell) for cell in cells]
         if len(cells) == len(header):
             driver = dict(zip(header, cells))
@@ -338,15 +590,14 @@ def run_crawler(target: int = 150, out: str = "data/drivers.json"):
     print(f"\nFound {len(urls)} candidate driver pages. Scraping…\n")
 
 
+    fallback_data_from_list()   # fetch the list table once, before the workers start
+
     drivers = []
-    for i, url in enumerate(urls, 1):
-        print(f"  [{i:>3}/{len(urls)}] {url.split('/wiki/')[-1].replace('_',' ')}")
-        d = parse_driver_page(url)
-        if d and d.get("name") and len(d["name"]) > 3:
-
-            drivers.append(d)
-        # print(d)
-        time.sleep(0.5)   # polite crawl delay
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        for i, (url, d) in enumerate(zip(urls, ex.map(parse_driver_page, urls)), 1):
+            print(f"  [{i:>3}/{len(urls)}] {url.split('/wiki/')[-1].replace('_',' ')}")
+            if d and d.get("name") and len(d["name"]) > 3:
+                drivers.append(d)
 
     with open(out, "w", encoding="utf-8") as f:
         json.dump(drivers, f, ensure_ascii=False, indent=2)
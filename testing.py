@@ -1,14 +1,5 @@
-import urllib.request
-import re
-HEADERS = {"User-Agent": "Mozilla/5.0 (F1CrawlerBot/1.0; educational project)"}
-def fetch(url: str) -> str:
-    try:
-        req = urllib.request.Request(url, headers=HEADERS)
-        with urllib.request.urlopen(req, timeout=12) as r:
-            return r.read().decode(r.headers.get_content_charset("utf-8"), errors="replace")
-    except Exception as e:
-        print(f"  [WARN] {url}: {e}")
-        return ""
+from scraper import fetch_bytes, parse_stats, _extract_balanced_table, RE_INFOBOX_START
+
 # url = "https://en.wikipedia.org/wiki/Ernesto_Brambilla"
 # url = "https://en.wikipedia.org/wiki/Johnny_Cecotto"
 # url = 'https://en.wikipedia.org/wiki/Edgar_Barth'
@@ -73,7 +64,8 @@ def fetch(url: str) -> str:
 # print(ib_stats.group(0))
 # # print(parse_number(ib_stats.group(0)))
 
-url = 'https://en.wikipedia.org/wiki/Alex_Albon'
-html = fetch(url)
-
-table
\ No newline at end of file
+if __name__ == "__main__":
+    url = 'https://en.wikipedia.org/wiki/Alex_Albon'
+    html = fetch_bytes(url)
+    statbox = _extract_balanced_table(html, RE_INFOBOX_START, b"World Championship career")
+    print(parse_stats(statbox))   # the career stats the experiments above were checking